@@ -1,6 +1,7 @@
 import itertools
 import sympy as sp
 from means.approximation.mea.mea_helpers import get_one_over_n_factorial, derive_expr_from_counter_entry
+from means.util.sympyhelpers import sympy_sum_list
 
 
 def generate_dmu_over_dt(species, propensity, n_counter, stoichiometry_matrix):
@@ -33,5 +34,15 @@ def generate_dmu_over_dt(species, propensity, n_counter, stoichiometry_matrix):
     factorial_terms = [get_one_over_n_factorial(tuple(c.n_vector)) for c in n_counter] * len(propensity)
     # we make a matrix in which every element is the entry-wise multiplication of `derives` and factorial_terms
     taylor_exp_matrix = sp.Matrix(len(propensity), len(n_counter), [d*f for (d, f) in zip(derives, factorial_terms)])
-    # dmu_over_dt is the product of the stoichiometry matrix by the taylor expansion matrix
-    return stoichiometry_matrix * taylor_exp_matrix
+    # dmu_over_dt is the product of the stoichiometry matrix by the taylor expansion matrix.
+    # The stoichiometry entries are plain (and mostly zero) integers, so instead of a full
+    # symbolic matrix product we accumulate each row ourselves, skipping the vanishing terms
+    taylor_exp_rows = taylor_exp_matrix.tolist()
+    dmu_over_dt = []
+    for species_idx in range(stoichiometry_matrix.rows):
+        coefficients = [int(stoichiometry_matrix[species_idx, reac_idx])
+                        for reac_idx in range(stoichiometry_matrix.cols)]
+        dmu_over_dt.append([sympy_sum_list([coef * taylor_exp_rows[reac_idx][col]
+                                            for (reac_idx, coef) in enumerate(coefficients) if coef != 0])
+                            for col in range(len(n_counter))])
+    return sp.Matrix(dmu_over_dt)
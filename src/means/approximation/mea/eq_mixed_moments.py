@@ -1,11 +1,12 @@
 import itertools
 import sympy as sp
 from means.approximation.mea.mea_helpers import get_one_over_n_factorial, derive_expr_from_counter_entry, make_k_chose_e
-from means.util.sympyhelpers import sum_of_cols, product
+from means.util.sympyhelpers import product, sympy_sum_list
 from means.util.decorators import cache
+from means.util.memoisation import memoised_property, MemoisableObject
 
 
-class DBetaOverDtCalculator(object):
+class DBetaOverDtCalculator(MemoisableObject):
     """
     A class providing a efficient way to recursively calculate :math:`\\frac{d\\beta}{dt}` (eq. 11 in  [Ale2013]_).
     A class was used here merely for optimisation reasons.
@@ -23,9 +24,11 @@ class DBetaOverDtCalculator(object):
         :param species: the names of the variables/species
 
         """
-        self.__propensities = propensities
-        self.__n_counter = n_counter
-        self.__stoichoimetry_matrix = stoichoimetry_matrix
+        # immutable matrices are hashable and backed by tuples, which keeps them
+        # safe (and slightly cheaper) to use from the memoised methods below
+        self.__propensities = sp.ImmutableMatrix(propensities)
+        self.__n_counter = tuple(n_counter)
+        self.__stoichoimetry_matrix = sp.ImmutableMatrix(stoichoimetry_matrix)
         self.__species = tuple(species)
 
     def get(self, k_vec, e_counter):
@@ -38,39 +41,44 @@ class DBetaOverDtCalculator(object):
         :param e_counter: :math:`e` in eq. 11
         :return: :math:`\frac{d\beta}{dt}`
         """
+        # everything else the result depends on is fixed per instance,
+        # so the whole row vector can be memoised on (k, e)
+        return self._cached_get(tuple(k_vec), tuple(e_counter))
 
+    @cache
+    def _cached_get(self, k_vec, e_counter):
         if len(e_counter) == 0:
             return sp.Matrix(1, len(self.__n_counter), lambda i, j: 0)
 
-        # compute F(x) for EACH REACTION and EACH entry in the EKCOUNTER (eq. 12)
-        f_of_x_vec = [self._make_f_of_x(k_vec, ek.n_vector, reac) for (reac, ek)
-                      in itertools.product(self.__propensities, e_counter)]
-
-        # compute <F> from f(x) (eq. 12). The result is a list in which each element is a
-        # vector in which each element relates to an entry of counter
-        f_expectation_vec = [self._make_f_expectation(f) for f in f_of_x_vec]
+        reaction_e_pairs = list(itertools.product(range(len(self.__propensities)), e_counter))
 
         # compute s^e for EACH REACTION and EACH entry in the EKCOUNTER . this is a list of scalars
-        s_pow_e_vec = sp.Matrix([self._make_s_pow_e(reac_idx, ek.n_vector) for (reac_idx, ek)
-                                 in itertools.product(range(len(self.__propensities)), e_counter)])
+        s_pow_e_vec = [self._make_s_pow_e(reac_idx, tuple(ek.n_vector)) for (reac_idx, ek)
+                       in reaction_e_pairs]
 
         # compute (k choose e) for EACH REACTION and EACH entry in the EKCOUNTER . This is a list of scalars.
         # Note that this does not depend on the reaction, so we can just repeat the result for each reaction
-        k_choose_e_vec = sp.Matrix(
-                [make_k_chose_e(ek.n_vector, k_vec) for ek in e_counter] *
-                len(self.__propensities)
-                )
-
-        # compute the element-wise product of the three entities
-        s_times_ke = s_pow_e_vec.multiply_elementwise(k_choose_e_vec)
-        prod = [list(f * s_ke) for (f, s_ke) in zip(f_expectation_vec, s_times_ke)]
-
-        # we have a list of vectors and we want to obtain a list of sums of all nth element together.
-        # To do that we put all the data into a matrix in which each row is a different vector
-        to_sum = sp.Matrix(prod)
-
-        # then we sum over the columns -> row vector
-        mixed_moments = sum_of_cols(to_sum)
+        k_choose_e_vec = [make_k_chose_e(ek.n_vector, k_vec) for ek in e_counter] * len(self.__propensities)
+
+        # compute the element-wise product of the two scalar entities. These stay plain
+        # lists of scalars -- there is no need to round-trip them through sympy matrices
+        s_times_ke = [s * ke for (s, ke) in zip(s_pow_e_vec, k_choose_e_vec)]
+
+        # compute F(x) and its expectation <F> (eq. 12) for the surviving terms only:
+        # stoichiometry matrices are mostly zeros, so many s^e scalars vanish, and the
+        # propensity derivatives behind <F> are by far the expensive part of this method
+        terms = []
+        for (reac_idx, ek), s_ke in zip(reaction_e_pairs, s_times_ke):
+            if s_ke == 0:
+                continue
+            f_of_x = self._make_f_of_x(k_vec, ek.n_vector, self.__propensities[reac_idx])
+            terms.append((self._make_f_expectation(f_of_x), s_ke))
+
+        # scale each expectation vector by its scalar and sum the vectors together,
+        # one counter entry at a time. The sums go straight into the final row
+        # vector -- no intermediate matrix is ever allocated
+        mixed_moments = sp.Matrix([[sympy_sum_list([f[i] * s_ke for (f, s_ke) in terms])
+                                    for i in range(len(self.__n_counter))]])
 
         return mixed_moments
 
@@ -85,10 +93,46 @@ class DBetaOverDtCalculator(object):
         :return: :math:`F()`
         """
 
-        # product of all values of {x ^ (k - e)} for all combination of e and k
-        prod = product([var ** (k_vec[i] - e_vec[i]) for i,var in enumerate(self.__species)])
+        monomial = self._make_x_pow_k_minus_e(tuple(k_vec), tuple(e_vec))
+
+        # if e == k the whole product vanishes and F() is the propensity itself
+        if monomial is sp.S.One:
+            return reaction
+
         # multiply the product by the propensity {a(x)}
-        return prod * reaction
+        return monomial * reaction
+
+    @cache
+    def _make_x_pow_k_minus_e(self, k_vec, e_vec):
+        r"""
+        The bare monomial :math:`x^{(k - e)}` of eq. 12.
+        It does not depend on the reaction, so it is memoised and shared between
+        all reactions requesting the same :math:`k` and :math:`e`.
+
+        :param k_vec: the vector :math:`k`, as a tuple
+        :param e_vec: the vector :math:`e`, as a tuple
+        :return: the monomial
+        """
+        # Factors with a zero exponent are just 1, so we leave them out rather than
+        # have sympy build and then cancel them
+        factors = [var ** (k_vec[i] - e_vec[i]) for i, var in enumerate(self.__species)
+                   if k_vec[i] != e_vec[i]]
+
+        if not factors:
+            return sp.S.One
+
+        return product(factors)
+
+    @memoised_property
+    def _factorial_terms(self):
+        """
+        The factorial terms for EACH entry in COUNTER.
+        They only depend on the counter, so they are computed once per instance
+        and reused for every expression passed to :meth:`_make_f_expectation`.
+
+        :rtype: :class:`sympy.Matrix`
+        """
+        return sp.Matrix([get_one_over_n_factorial(tuple(c.n_vector)) for c in self.__n_counter])
 
     @cache
     def _make_f_expectation(self, expr):
@@ -104,24 +148,31 @@ class DBetaOverDtCalculator(object):
         derives = sp.Matrix([derive_expr_from_counter_entry(expr, self.__species, tuple(c.n_vector))
                              for c in self.__n_counter])
 
-
-
-        # Computes the factorial terms for EACH entry in COUNTER
-        factorial_terms = sp.Matrix([get_one_over_n_factorial(tuple(c.n_vector)) for c in self.__n_counter])
-
-        # Element wise product of the two vectors
-        te_vector= derives.multiply_elementwise(factorial_terms)
+        # Element wise product of the derivatives and the (precomputed) factorial terms
+        te_vector = derives.multiply_elementwise(self._factorial_terms)
 
         return te_vector
 
+    @cache
     def _make_s_pow_e(self, reac_idx, e_vec):
         """
-        Compute s^e in equation 11  (see Ale et al. 2013)
+        Compute s^e in equation 11  (see Ale et al. 2013).
+        The stoichiometry matrix does not change over the lifetime of the calculator,
+        so the result is memoised on `(reac_idx, e_vec)`.
 
         :param reac_idx: the index (that is the column in the stoichiometry matrix)
          of the reaction to consider.
         :type reac_idx: `int`
-        :param e_vec: the vector e
+        :param e_vec: the vector e, as a tuple
         :return: a scalar (s^e)
         """
-        return product([self.__stoichoimetry_matrix[i, reac_idx] ** e for i,e in enumerate(e_vec)])
+        entries = [int(self.__stoichoimetry_matrix[i, reac_idx]) for i in range(len(e_vec))]
+
+        # a zero stoichiometry entry raised to a positive power annihilates the product
+        if any(entry == 0 and e > 0 for (entry, e) in zip(entries, e_vec)):
+            return sp.Integer(0)
+
+        result = 1
+        for entry, e in zip(entries, e_vec):
+            result *= entry ** e
+        return sp.Integer(result)
@@ -6,6 +6,7 @@ This part of the package provides a few small utility
 functions for the rest :mod:`~means.approximation.mea`.
 """
 
+import math
 import operator
 import sympy as sp
 from means.util.decorators import cache
@@ -24,6 +25,10 @@ def _cached_diff(expression, var):
     :return: the derived expression
     :type: :class:`~sympy.Expr`
     """
+    # the derivative of an expression that does not contain `var` is zero,
+    # there is no need to instantiate a `Derivative` (which walks the whole tree) for that
+    if not expression.has(var):
+        return sp.Integer(0)
     return sp.Derivative(expression, var, evaluate=True)
 
 
@@ -64,6 +69,18 @@ def derive_expr_from_counter_entry(expression, species, counter_entry):
     if sum(counter_entry) == 0:
         return expression
 
+    # delegate to the memoised helper. The same (expression, counter entry) pairs reoccur
+    # across reactions, so caching on the structural hash of the arguments saves
+    # re-deriving identical expressions over and over
+    return _cached_derive_expr(expression, tuple(species), tuple(counter_entry))
+
+
+@cache
+def _cached_derive_expr(expression, species, counter_entry):
+    """
+    Memoised work-horse for :func:`derive_expr_from_counter_entry`.
+    All arguments must be hashable (i.e. `species` and `counter_entry` are tuples).
+    """
     # repeat a variable as many time as its value in counter
     diff_vars = reduce(operator.add, map(lambda v, c: [v] * c, species, counter_entry))
     out_expr = expression
@@ -87,4 +104,17 @@ def make_k_chose_e(e_vec, k_vec):
     :type k_vec: :class:`numpy.array`
     :return: a scalar
     """
-    return product([sp.factorial(k) / (sp.factorial(e) * sp.factorial(k - e)) for e,k in zip(e_vec, k_vec)])
\ No newline at end of file
+    return _cached_k_chose_e(tuple(e_vec), tuple(k_vec))
+
+
+@cache
+def _cached_k_chose_e(e_vec, k_vec):
+    """
+    Memoised work-horse for :func:`make_k_chose_e`.
+    The arguments are small integer tuples, so the whole product is computed
+    with plain integer arithmetic and wrapped as a `sympy.Integer` only once.
+    """
+    result = 1
+    for e, k in zip(e_vec, k_vec):
+        result *= math.factorial(k) // (math.factorial(e) * math.factorial(k - e))
+    return sp.Integer(result)
\ No newline at end of file
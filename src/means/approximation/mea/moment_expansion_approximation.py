@@ -5,6 +5,7 @@ import sympy as sp
 
 from means.core import ODEProblem
 from means.approximation.approximation_baseclass import ApproximationBaseClass
+from means.util.decorators import cache
 from means.util.moment_counters import generate_n_and_k_counters
 
 from dmu_over_dt import generate_dmu_over_dt
@@ -27,10 +28,26 @@ def mea_approximation(model, max_order, closure='scalar', *closure_args, **closu
     about the options.
 
 
+    The expansion is deterministic in its inputs, so the results are memoised:
+    repeated calls with the same model, order and closure (e.g. from parameter
+    inference sweeps) return the previously computed problem at once.
+
     :return: an ODE problem which can be further used in inference and simulation.
     :rtype: :class:`~means.core.problems.ODEProblem`
     """
-    mea = MomentExpansionApproximation(model, max_order, closure=closure, *closure_args, **closure_kwargs)
+    return _cached_mea_approximation(model, int(max_order), closure,
+                                     closure_args, tuple(sorted(closure_kwargs.items())))
+
+
+@cache
+def _cached_mea_approximation(model, max_order, closure, closure_args, closure_kwargs_items):
+    """
+    Memoised work-horse for :func:`mea_approximation`. The closure arguments are
+    passed as hashable tuples so they can take part in the cache key alongside
+    the (hashable) :class:`~means.core.model.Model`.
+    """
+    mea = MomentExpansionApproximation(model, max_order, closure=closure,
+                                       *closure_args, **dict(closure_kwargs_items))
     return mea.run()
 
 
@@ -193,29 +210,41 @@ class MomentExpansionApproximation(ApproximationBaseClass):
         """
         positiv_raw_moms_symbs = [raw.symbol for raw in k_counter if raw.order > 1]
         # The symbols for the corresponding central moment
-        central_symbols= [central.symbol for central in n_counter if central.order > 1]
-        # Now we state (central_symbols == central_from_raw_exprs)
-        eq_to_solve = [cfr - cs for (cs, cfr) in zip(central_symbols, central_from_raw_exprs)]
-
-        # And we solve this for the symbol of the corresponding raw moment. This gives an expression
+        central_symbols = [central.symbol for central in n_counter if central.order > 1]
+        # Now we state (central_symbols == central_from_raw_exprs) and solve it for the
+        # symbol of the corresponding raw moment, in one pass. This gives an expression
         # of the symbol for raw moment in terms of central moments and lower order raw moment
-        solved_xs = sp.Matrix([quick_solve(eq,raw) for (eq, raw) in zip(eq_to_solve, positiv_raw_moms_symbs)])
+        solved_xs = [quick_solve(cfr - cs, raw) for (cs, cfr, raw)
+                     in zip(central_symbols, central_from_raw_exprs, positiv_raw_moms_symbs)]
 
         # now we want to express raw moments only in terms od central moments and means
         # for instance if we have: :math:`x_1 = 1; x_2 = 2 +x_1 and  x_3 = x_2*x_1`, we should give:
         # :math:`x_1 = 1; x_2 = 2+1 and  x_3 = 1*(2+1)`
-        # To achieve this, we recursively apply substitution as many times as the highest order (minus one)
-        max_order = max([p.order for p in k_counter])
-
-        for i in range(max_order - 1):
-            substitution_pairs = zip(positiv_raw_moms_symbs, solved_xs)
-            solved_xs = substitute_all(solved_xs, substitution_pairs)
-
-        # we finally build substitution pairs to replace all raw moments
-        substitution_pairs = zip(positiv_raw_moms_symbs, solved_xs)
-
-        # apply this substitution to all elements of the central moment expressions matrix
-        out_exprs = substitute_all(central_moments_exprs, substitution_pairs)
-
-        return out_exprs
+        # Each solved expression only references raw moments of strictly lower order, and
+        # `k_counter` is ordered by increasing order, so composing the substitutions in a
+        # single forward pass already expresses every raw moment in terms of central
+        # moments and means -- no repeated sweeps over the whole vector are needed
+        substitution_pairs = {}
+        for raw_symbol, solved_x in zip(positiv_raw_moms_symbs, solved_xs):
+            substitution_pairs[raw_symbol] = substitute_all(solved_x, substitution_pairs)
+
+        # factor the shared subexpressions out of the central moment matrix first,
+        # so the substitution walks every repeated subtree once rather than
+        # once per occurrence
+        cse_replacements, reduced_exprs = sp.cse(list(central_moments_exprs),
+                                                 symbols=sp.numbered_symbols('_cse_tmp_'))
+
+        # substitute raw moments inside the shared subexpressions, expanding
+        # previously-processed temporaries along the way
+        expanded_temporaries = {}
+        for temporary, subexpr in cse_replacements:
+            subexpr = substitute_all(subexpr, expanded_temporaries)
+            expanded_temporaries[temporary] = substitute_all(subexpr, substitution_pairs)
+
+        # put the (already substituted) subexpressions back and deal with the raw
+        # moments at the top level of each reduced expression
+        out_exprs = [substitute_all(substitute_all(expr, expanded_temporaries), substitution_pairs)
+                     for expr in reduced_exprs]
+
+        return sp.Matrix(central_moments_exprs.rows, central_moments_exprs.cols, out_exprs)
 
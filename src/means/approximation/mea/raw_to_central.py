@@ -1,6 +1,7 @@
 import operator
 import sympy as sp
 from means.approximation.mea.mea_helpers import make_k_chose_e
+from means.util.decorators import cache
 
 
 def _make_alpha(n_vec, k_vec, ymat):
@@ -35,6 +36,17 @@ def raw_to_central(n_counter, species, k_counter):
 
     :return: a vector of central moments expressed in terms of raw moment
     """
+    # the function is pure in its (hashable) arguments, so the expensive symbolic
+    # work is memoised module-wide and shared between approximation runs. A fresh
+    # matrix is returned so the cached one cannot be mutated by the caller
+    return sp.Matrix(_cached_raw_to_central(tuple(n_counter), tuple(species), tuple(k_counter)))
+
+
+@cache
+def _cached_raw_to_central(n_counter, species, k_counter):
+    """
+    Memoised work-horse for :func:`raw_to_central`.
+    """
     # create empty output
     central_in_terms_of_raw = []
     # This loop loops through the ::math::`[n_1, ..., n_d]` vectors of the sums in the beginning of the equation
@@ -170,6 +170,10 @@ class Moment(ODETermBase):
         self.__n_vector = np.array(n_vector, dtype=int)
         self.__order = sum(self.n_vector)
         self.__descriptor = self.n_vector
+        # moments are routinely used as dictionary keys (e.g. in memoised helpers),
+        # and the n_vector never changes, so the hash is computed once up front
+        # rather than rendering the numpy repr on every lookup
+        self.__hash = hash(repr(self.__n_vector))
 
     @property
     def descriptor(self):
@@ -200,7 +204,7 @@ class Moment(ODETermBase):
 
     def __hash__(self):
         # Allows moment objects to be stored as keys to dictionaries
-        return hash(repr(self.n_vector))
+        return self.__hash
 
     def __eq__(self, other):
         if not isinstance(other, self.__class__):
@@ -86,7 +86,7 @@ class ODEProblem(SerialisableObject, LatexPrintableObject, MemoisableObject):
     def left_hand_side(self):
         return self.__left_hand_side
 
-    @property
+    @memoised_property
     def variables(self):
         return to_list_of_symbols(self.__left_hand_side)
 
@@ -138,12 +138,22 @@ class ODEProblem(SerialisableObject, LatexPrintableObject, MemoisableObject):
         :return:
         :rtype: function
         """
-        wrapped_functions = self._right_hand_side_as_numeric_functions
+        wrapped_functions = tuple(self._right_hand_side_as_numeric_functions)
+        number_of_equations = len(wrapped_functions)
+        number_of_parameters = self.number_of_parameters
+
+        # reuse a single preallocated buffer for the argument values --
+        # solvers evaluate this function thousands of times per simulation and
+        # `np.concatenate` would allocate a fresh array on every call
+        all_values = np.empty(number_of_parameters + self.number_of_equations, dtype=np.double)
 
         def f(values_for_variables, values_for_constants):
-            all_values = np.concatenate((values_for_constants, values_for_variables))
-            ans = np.array([w_f(*all_values) for w_f in wrapped_functions])
-            return ans
+            all_values[:number_of_parameters] = values_for_constants
+            all_values[number_of_parameters:] = values_for_variables
+            # `fromiter` fills the result array directly from the compiled functions,
+            # skipping the intermediate list a plain `np.array(...)` would build
+            return np.fromiter((w_f(*all_values) for w_f in wrapped_functions),
+                               dtype=np.double, count=number_of_equations)
 
         return f
 
@@ -114,10 +114,14 @@ def _wrap_results_to_trajectories(simulated_timepoints, simulated_values, descri
     assert(len(descriptions) == number_of_simulated_values)
     assert(len(simulated_timepoints) == number_of_timepoints)
 
+    # Transpose to one-row-per-equation layout in a single pass, so each trajectory
+    # below copies a contiguous row rather than a strided column view
+    values_per_equation = np.ascontiguousarray(simulated_values.T)
+
     # Wrap results to trajectories
     trajectories = []
-    for description, simulated_value_column in zip(descriptions, simulated_values.T):
-        trajectories.append(Trajectory(simulated_timepoints, simulated_value_column, description))
+    for description, simulated_value_row in zip(descriptions, values_per_equation):
+        trajectories.append(Trajectory(simulated_timepoints, simulated_value_row, description))
 
     return trajectories
 
@@ -169,6 +173,9 @@ class SolverBase(MemoisableObject):
         :return: a list of trajectories for each of the equations in the problem.
         """
         solver = self._solver
+        # all timepoints are passed to the solver in one go (via `ncp_list`),
+        # rather than repeatedly re-entering it for each timepoint
+        timepoints = to_one_dim_array(timepoints, dtype=NP_FLOATING_POINT_PRECISION)
         last_timepoint = timepoints[-1]
         try:
             simulated_timepoints, simulated_values = solver.simulate(last_timepoint, ncp_list=timepoints)
@@ -45,7 +45,7 @@ class TestEqMixedMoments(unittest.TestCase):
         Moment([2, 0, 0], sympy.Symbol("yx6"))
         ]
 
-        species = sympy.Matrix(["y_0", "y_1", "y_2"])
+        species = sympy.symbols(["y_0", "y_1", "y_2"])
 
         dbdt_calc = DBetaOverDtCalculator(propensities, counter,stoichio, species)
         k_vec = [1, 0, 0]
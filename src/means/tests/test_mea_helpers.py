@@ -15,7 +15,7 @@ class TaylorExpansionTestCase(unittest.TestCase):
 
         expr = sp.simplify("c_0*y_0*(y_0 + y_1 - 181)/(y_2+c_1*y_1)")
 
-        vars = sp.simplify(["y_0", "y_1", "y_2"])
+        vars = sp.symbols(["y_0", "y_1", "y_2"])
 
         count_entr_a = (0, 1, 3)
         count_entr_b = (1, 1, 0)
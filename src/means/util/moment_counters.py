@@ -6,9 +6,25 @@ This part of the package provides a function to generate all mixed and "pure" ra
 :class:`~means.core.descriptor.Moment`s up to a maximal_order.
 """
 
-import itertools
 import sympy as sp
 from means.core import Moment
+from means.util.decorators import cache
+
+
+def _moment_descriptors(max_sum, num_species):
+    """
+    Yields every tuple of `num_species` non-negative integers whose sum does not
+    exceed `max_sum`, in lexicographic order. Unlike filtering the full cartesian
+    product, the work is proportional to the number of tuples yielded, which
+    matters for models with many species.
+    """
+    if num_species == 1:
+        for i in range(max_sum + 1):
+            yield (i,)
+        return
+    for i in range(max_sum + 1):
+        for tail in _moment_descriptors(max_sum - i, num_species - 1):
+            yield (i,) + tail
 
 def generate_n_and_k_counters(max_order, species, central_symbols_prefix="M_", raw_symbols_prefix="x_"):
         r"""
@@ -23,6 +39,19 @@ def generate_n_and_k_counters(max_order, species, central_symbols_prefix="M_", r
         and raw moments, respectively.
         :rtype: (list[:class:`~mea ns.core.descriptors.Moment`],list[:class:`~mea ns.core.descriptors.Moment`])
         """
+        n_counter, k_counter = _generate_n_and_k_counters(max_order, tuple(species),
+                                                          central_symbols_prefix, raw_symbols_prefix)
+        # return fresh lists so the memoised ones cannot be mutated by the caller
+        return list(n_counter), list(k_counter)
+
+
+@cache
+def _generate_n_and_k_counters(max_order, species, central_symbols_prefix, raw_symbols_prefix):
+        """
+        Memoised work-horse for :func:`generate_n_and_k_counters` -- repeated runs
+        over the same (max_order, species) combination reuse the same
+        :class:`~means.core.descriptors.Moment` objects.
+        """
         n_moments = max_order + 1
         # first order moments are always 1
         k_counter = [Moment([0] * len(species), sp.Integer(1))]
@@ -39,11 +68,11 @@ def generate_n_and_k_counters(max_order, species, central_symbols_prefix="M_", r
         k_counter += [Moment(d, s) for d,s in zip(descriptors, species)]
 
         # Higher order raw moment descriptors
-        k_counter_descriptors = [i for i in itertools.product(range(n_moments + 1), repeat=len(species))
-                                 if 1 < sum(i) <= n_moments]
+        k_counter_descriptors = [i for i in _moment_descriptors(n_moments, len(species))
+                                 if sum(i) > 1]
 
         #this mimics the order in the original code
-        k_counter_descriptors = sorted(k_counter_descriptors,lambda x,y: sum(x) - sum(y))
+        k_counter_descriptors = sorted(k_counter_descriptors, key=sum)
         #k_counter_descriptors = [[r for r in reversed(k)] for k in k_counter_descriptors]
 
         k_counter_symbols = [sp.Symbol(raw_symbols_prefix + "_".join([str(s) for s in count]))
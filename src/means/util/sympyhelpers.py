@@ -23,20 +23,30 @@ def substitute_all(sp_object, pairs):
     else:
         dict_pairs = pairs
 
-    # we recurse if the object was a matrix so we apply substitution to all elements
+    # matrices in sympy 0.7.x have no `xreplace` of their own, so we rebuild them
+    # through the constructor, substituting every cell in a single pass rather than
+    # dispatching through `applyfunc`'s per-cell lambda
     if isinstance(sp_object, sympy.Matrix):
-        return sp_object.applyfunc(lambda x: substitute_all(x, dict_pairs))
+        return sympy.Matrix(sp_object.rows, sp_object.cols,
+                            [_substitute_expression(x, dict_pairs) for x in sp_object])
 
+    return _substitute_expression(sp_object, dict_pairs)
+
+
+def _substitute_expression(expr, dict_pairs):
+    """
+    Substitutes `dict_pairs` into a single (non-matrix) expression.
+
+    Private function. Use :func:`substitute_all`.
+    """
     try:
-        expr = sp_object.xreplace(dict_pairs)
+        return expr.xreplace(dict_pairs)
 
     # in sympy 0.7.2, this would not work, so we do it manually
     except Exception:
-        expr =  sp_object
-        for (a,b) in dict_pairs.items():
+        for (a, b) in dict_pairs.items():
             expr = sympy.Subs(expr, a, b)
-        expr = expr.doit()
-    return expr
+        return expr.doit()
 
 def quick_solve(expr, var):
         r"""
@@ -55,8 +65,10 @@ def quick_solve(expr, var):
         res = -(expr - var)
 
         # This may not work every time,
-        # so we fallback on the --slow-- `solve()` if we failed
-        if var in res.args:
+        # so we fallback on the --slow-- `solve()` if we failed.
+        # `has` searches the whole tree: the variable may survive inside
+        # a product (e.g. `2*var`) where a top-level `in res.args` test misses it
+        if res.has(var):
             return sympy.solve(expr, var)
         return res
 
@@ -172,25 +184,19 @@ def _sympy_matrices_equal(matrix_left, matrix_right):
 
 
 
-def _eval_res_equal(expr1, expr2, atoms, vals,threshold=10e-10):
+def _eval_res_equal(function_1, function_2, vals, threshold=10e-10):
 
     """
-    Compare two expressions after evaluation of symbols by random expressions
+    Compare two lambdified expressions evaluated at the given values
 
     private function called by `sympy_empirical_equal`
 
-    :param expr1: a first sympy expression
-    :param expr2: a second sympy expression
-    :param atoms: the component symbols (they are assumed to be common)
-    :param vals: the values to subtitute atoms with
+    :param function_1: a first lambdified expression
+    :param function_2: a second lambdified expression
+    :param vals: the values to evaluate the functions at
     :return: True if the result is the same
     """
-    substitution_pairs = zip(atoms, vals)
-
-    eval_1 = substitute_all(expr1, substitution_pairs)
-    eval_2 = substitute_all(expr2, substitution_pairs)
-
-    return abs(eval_1 - eval_2) < threshold
+    return abs(function_1(*vals) - function_2(*vals)) < threshold
 
 
 def sympy_empirical_equal(expr1, expr2):
@@ -210,8 +216,12 @@ def sympy_empirical_equal(expr1, expr2):
 
 
     # lets us merge symbol in case one equation has more / different symbols
-    atoms = set(atoms_1 + atoms_2)
+    atoms = sorted(set(atoms_1 + atoms_2), key=str)
 
+    # lambdify each expression once, rather than walking the trees
+    # with symbolic substitution for every set of values
+    function_1 = sympy.lambdify(atoms, expr1)
+    function_2 = sympy.lambdify(atoms, expr2)
 
     arbitrary_values = []
     arbitrary_values.append([i * 7.1 for i in range(1,len(atoms)+1)])
@@ -220,7 +230,7 @@ def sympy_empirical_equal(expr1, expr2):
 
     # test for arbitrary value. return false at the first failure
     for av in arbitrary_values:
-        if not _eval_res_equal(expr1, expr2, atoms, av):
+        if not _eval_res_equal(function_1, function_2, av):
             return False
 
     return True
@@ -235,11 +245,20 @@ def sum_of_cols(mat):
 
 import operator
 
-def product(list):
-    return reduce(operator.mul, list)
-
-def sympy_sum_list(list):
-    return reduce(operator.add, list)
+def product(terms):
+    # n-ary Mul canonicalises once, unlike pairwise reduction which
+    # re-canonicalises at every step. Only sympy scalars can go through it --
+    # matrices and numpy arrays still need the pairwise multiplication
+    terms = list(terms)
+    if all(isinstance(t, sympy.Expr) for t in terms):
+        return sympy.Mul(*terms)
+    return reduce(operator.mul, terms)
+
+def sympy_sum_list(terms):
+    terms = list(terms)
+    if all(isinstance(t, sympy.Expr) for t in terms):
+        return sympy.Add(*terms)
+    return reduce(operator.add, terms)
 
 def to_one_dim_array(iterable_, dtype=np.double):
     return np.array(iterable_, dtype = dtype).reshape(-1,)